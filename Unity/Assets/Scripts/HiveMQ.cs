@@ -6,6 +6,8 @@ using System.Threading.Tasks;
 using MQTTnet;
 using MQTTnet.Client;
 using MQTTnet.Client.Options;
+using MQTTnet.Client.Subscribing;
+using MQTTnet.Protocol;
 using UnityEngine;
 
 public class MqttConveyorController : MonoBehaviour
@@ -39,14 +41,16 @@ public class MqttConveyorController : MonoBehaviour
         {
             Debug.Log("[MQTT] Connected to broker");
 
-            await _client.SubscribeAsync(stopTopic);
-            Debug.Log("[MQTT] Subscribed to " + stopTopic);
+            // One SUBSCRIBE packet for all topics instead of a round-trip per topic.
+            // These are control commands, so ask for QoS 1 delivery.
+            var subscribeOptions = new MqttClientSubscribeOptionsBuilder()
+                .WithTopicFilter(stopTopic, MqttQualityOfServiceLevel.AtLeastOnce)
+                .WithTopicFilter(fwdTopic, MqttQualityOfServiceLevel.AtLeastOnce)
+                .WithTopicFilter(bwdTopic, MqttQualityOfServiceLevel.AtLeastOnce)
+                .Build();
 
-            await _client.SubscribeAsync(fwdTopic);
-            Debug.Log("[MQTT] Subscribed to " + fwdTopic);
-
-            await _client.SubscribeAsync(bwdTopic);
-            Debug.Log("[MQTT] Subscribed to " + bwdTopic);
+            await _client.SubscribeAsync(subscribeOptions, CancellationToken.None);
+            Debug.Log($"[MQTT] Subscribed to {stopTopic}, {fwdTopic}, {bwdTopic}");
         });
 
         // Handle incoming messages